@@ -56,7 +56,7 @@ class PoliticalChatbotApp:
         if api_key:
             self.ai_service = AIService(api_key)
 
-        self.page_manager = PageManager(self.data_service, self.ai_service)
+        self.page_manager = PageManager(self.data_service, self.ai_service, self.ui)
 
     def _get_api_key(self) -> Optional[str]:
         """Get API key from Streamlit secrets or environment variables."""
@@ -0,0 +1,43 @@
+import json
+import math
+import os
+from pathlib import Path
+
+import orjson
+
+
+def _has_non_finite(value) -> bool:
+    """Check whether data contains NaN/Infinity floats, which orjson would write as null."""
+    if isinstance(value, float):
+        return not math.isfinite(value)
+    if isinstance(value, dict):
+        return any(_has_non_finite(v) for v in value.values())
+    if isinstance(value, (list, tuple)):
+        return any(_has_non_finite(v) for v in value)
+    return False
+
+
+def read_json(filepath: str):
+    """Load a JSON file with orjson, falling back to json for files containing NaN/Infinity."""
+    raw = Path(filepath).read_bytes()
+    try:
+        return orjson.loads(raw)
+    except orjson.JSONDecodeError:
+        return json.loads(raw)
+
+
+def write_json(filepath: str, data) -> None:
+    """Write data as indented UTF-8 JSON atomically.
+
+    Data with NaN/Infinity (e.g. a degenerate Cohen's d) is written with json so those
+    values stay NaN/Infinity instead of turning into null.
+    """
+    if _has_non_finite(data):
+        payload = json.dumps(data, ensure_ascii=False, indent=2).encode('utf-8')
+    else:
+        payload = orjson.dumps(data, option=orjson.OPT_INDENT_2 | orjson.OPT_SERIALIZE_NUMPY)
+
+    tmp_path = f"{filepath}.tmp"
+    with open(tmp_path, 'wb') as f:
+        f.write(payload)
+    os.replace(tmp_path, filepath)
@@ -3,7 +3,6 @@ Complete DSPy Optimization Pipeline with Integrated Simulator
 Run everything in one go with: python optimizer.py
 """
 
-import json
 import os
 from pathlib import Path
 from datetime import datetime
@@ -13,6 +12,7 @@ import time
 import csv
 
 import dspy
+import orjson
 from google import genai as google_genai
 from google.genai import types
 import pandas as pd
@@ -22,6 +22,8 @@ import matplotlib.pyplot as plt
 import seaborn as sns
 import toml
 
+from json_io import read_json, write_json
+
 # =====================================
 # Configuration
 # =====================================
@@ -119,6 +121,11 @@ def load_intervention(filename):
         return f.read()
 
 
+def save_parquet(df: pd.DataFrame, filepath: str) -> None:
+    """Save a tabular result as zstd-compressed Parquet."""
+    df.to_parquet(filepath, compression='zstd', index=False)
+
+
 def generate_conversation(fake_user_profile, intervention_prompt, fake_user_name,
                          intervention_name, output_dir):
     """Generate a single conversation using Gemini."""
@@ -233,8 +240,7 @@ def generate_conversation(fake_user_profile, intervention_prompt, fake_user_name
     json_path = os.path.join(output_dir, f"{base_name}.json")
     csv_path = os.path.join(output_dir, f"{base_name}.csv")
 
-    with open(json_path, 'w', encoding='utf-8') as f:
-        json.dump(conversation_data, f, ensure_ascii=False, indent=2)
+    write_json(json_path, conversation_data)
 
     save_conversation_csv(conversation, csv_path)
 
@@ -269,6 +275,7 @@ def generate_all_conversations(output_dir: str, num_profiles: int = None):
     print(f"Total conversations to generate: {len(fake_users) * len(interventions)}")
     print(f"{'='*60}\n")
 
+    summary_rows = []
     count = 0
     for fake_user_file in fake_users:
         try:
@@ -297,8 +304,19 @@ def generate_all_conversations(output_dir: str, num_profiles: int = None):
                     output_dir
                 )
 
-                print(f"✅ Completed: {conversation_data['metadata']['total_messages']} messages, "
-                      f"{conversation_data['metadata']['duration_seconds']:.1f}s")
+                metadata = conversation_data['metadata']
+                summary_rows.append({
+                    'profile_id': conversation_data['profile_id'],
+                    'intervention': conversation_data['intervention'],
+                    'n_turns': metadata['total_messages'],
+                    'duration_s': metadata['duration_seconds'],
+                    'ending_reason': metadata['ending_reason'],
+                    'web_search_enabled': metadata['web_search_enabled'],
+                    'start_time': metadata['start_time'],
+                })
+
+                print(f"✅ Completed: {metadata['total_messages']} messages, "
+                      f"{metadata['duration_seconds']:.1f}s")
 
                 time.sleep(2)  # Rate limiting
 
@@ -306,6 +324,9 @@ def generate_all_conversations(output_dir: str, num_profiles: int = None):
                 print(f"❌ Error generating conversation: {e}")
                 continue
 
+    if summary_rows:
+        save_parquet(pd.DataFrame(summary_rows), os.path.join(output_dir, 'summary.parquet'))
+
 
 # =====================================
 # Phase 2: LLM Judge
@@ -351,7 +372,7 @@ def evaluate_conversation(conversation: List[Dict]) -> Dict[str, float]:
             )
         )
 
-        scores = json.loads(response.text)
+        scores = orjson.loads(response.text)
         scores['overall'] = np.mean([
             scores['reduces_polarization'],
             scores['natural_flow'],
@@ -381,8 +402,7 @@ def evaluate_all_conversations(conversations_dir: str) -> pd.DataFrame:
     for i, filename in enumerate(conv_files, 1):
         print(f"Evaluating {i}/{len(conv_files)}: {filename}... ", end="", flush=True)
 
-        with open(os.path.join(conversations_dir, filename), 'r', encoding='utf-8') as f:
-            data = json.load(f)
+        data = read_json(os.path.join(conversations_dir, filename))
 
         scores = evaluate_conversation(data['conversation'])
 
@@ -439,8 +459,7 @@ def prepare_training_data(evaluations_df: pd.DataFrame,
     for _, row in pd.concat([good_convs, poor_convs]).iterrows():
         filepath = os.path.join(conversations_dir, row['filename'])
 
-        with open(filepath, 'r', encoding='utf-8') as f:
-            data = json.load(f)
+        data = read_json(filepath)
 
         conversation = data['conversation']
         for i in range(0, len(conversation) - 1, 2):
@@ -529,8 +548,7 @@ def extract_optimized_prompts(optimized_module: dspy.Module,
     # Sample high-scoring conversations to extract patterns
     for _, row in high_scoring.head(5).iterrows():
         filepath = os.path.join(conversations_dir, row['filename'])
-        with open(filepath, 'r', encoding='utf-8') as f:
-            data = json.load(f)
+        data = read_json(filepath)
 
         for msg in data['conversation']:
             if msg['role'] == 'assistant':
@@ -722,6 +740,7 @@ def main():
     original_evals = evaluate_all_conversations(ORIGINAL_CONVS_DIR)
     eval_path = os.path.join(EVALUATIONS_DIR, 'original_evaluations.csv')
     original_evals.to_csv(eval_path, index=False, encoding='utf-8-sig')
+    save_parquet(original_evals, os.path.join(EVALUATIONS_DIR, 'original_evaluations.parquet'))
     print(f"\n✓ Saved to {eval_path}")
 
     print("\nOriginal Scores by Intervention:")
@@ -822,14 +841,14 @@ def main():
     optimized_evals = evaluate_all_conversations(OPTIMIZED_CONVS_DIR)
     opt_eval_path = os.path.join(EVALUATIONS_DIR, 'optimized_evaluations.csv')
     optimized_evals.to_csv(opt_eval_path, index=False, encoding='utf-8-sig')
+    save_parquet(optimized_evals, os.path.join(EVALUATIONS_DIR, 'optimized_evaluations.parquet'))
     print(f"\n✓ Saved to {opt_eval_path}")
 
     comparison = compare_results(original_evals, optimized_evals)
 
     # Save results
     comparison_path = os.path.join(STATS_DIR, 'comparison_results.json')
-    with open(comparison_path, 'w', encoding='utf-8') as f:
-        json.dump(comparison, f, indent=2, ensure_ascii=False)
+    write_json(comparison_path, comparison)
 
     summary_df = pd.DataFrame(comparison).T
     summary_path = os.path.join(STATS_DIR, 'optimization_summary.csv')
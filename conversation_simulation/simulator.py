@@ -1,4 +1,3 @@
-import json
 import os
 from datetime import datetime
 from google import genai as google_genai
@@ -8,6 +7,8 @@ import random
 from pathlib import Path
 import toml
 
+from json_io import write_json
+
 # =====================================
 # Configuration
 # =====================================
@@ -265,8 +266,7 @@ def main():
                 json_path = os.path.join(OUTPUT_DIR, f"{base_name}.json")
                 csv_path = os.path.join(OUTPUT_DIR, f"{base_name}.csv")  # ✅ חדש
 
-                with open(json_path, 'w', encoding='utf-8') as f:
-                    json.dump(conversation_data, f, ensure_ascii=False, indent=2)
+                write_json(json_path, conversation_data)
 
                 # ✅ שמירת ה-CSV
                 save_conversation_csv(conversation_data["conversation"], csv_path)
@@ -19,7 +19,7 @@ def quick_tier_check(api_key: str) -> str:
             )
             count += 1
             time.sleep(0.2)
-        except:
+        except Exception:
             break
 
     return "PAID" if count >= 16 else "FREE"
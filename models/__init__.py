@@ -1,4 +1,4 @@
-from .user_profile import UserProfile
+from .user_profile import UserProfile, profile_to_dict
 from .chat_message import ChatMessage
 
-__all__ = ['UserProfile', 'ChatMessage']
\ No newline at end of file
+__all__ = ['UserProfile', 'ChatMessage', 'profile_to_dict']
\ No newline at end of file
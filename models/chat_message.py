@@ -8,15 +8,19 @@ class ChatMessage:
     role: str
     content: str
     timestamp: str = None
+    ts_ms: int = None
 
     def __post_init__(self):
         if self.timestamp is None:
-            self.timestamp = datetime.now().isoformat()
+            now = datetime.now()
+            self.timestamp = now.isoformat()
+            self.ts_ms = int(now.timestamp() * 1000)
 
     def to_dict(self) -> dict:
         """Convert to dictionary for storage."""
         return {
             "role": self.role,
             "content": self.content,
-            "timestamp": self.timestamp
-        }
\ No newline at end of file
+            "timestamp": self.timestamp,
+            "ts_ms": self.ts_ms
+        }
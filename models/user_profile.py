@@ -1,4 +1,4 @@
-from dataclasses import dataclass, field
+from dataclasses import dataclass, field, fields
 from typing import List, Dict
 import uuid
 from datetime import datetime
@@ -57,6 +57,10 @@ class UserProfile:
     most_interesting: str = ""
     changed_mind: str = ""
 
+    def to_dict(self) -> Dict:
+        """Convert to dictionary for storage."""
+        return profile_to_dict(self)
+
     # Legacy properties for backward compatibility
     @property
     def feeling_thermometer(self) -> Dict[str, int]:
@@ -89,4 +93,22 @@ class UserProfile:
 
     @property
     def gaza_position_post(self) -> str:
-        return ""
\ No newline at end of file
+        return ""
+
+
+# Field names in declaration order, so profile_to_dict skips non-field attributes set on instances
+_FIELD_NAMES = tuple(f.name for f in fields(UserProfile))
+
+
+def profile_to_dict(profile) -> Dict:
+    """Convert a profile to a dictionary for storage; list/dict answers are copied one level.
+
+    Works on instances created by an older version of the class (e.g. kept in session state
+    across a reload), which may lack the to_dict method or newer fields.
+    """
+    values = vars(profile)
+    data = {}
+    for name in _FIELD_NAMES:
+        value = values.get(name)
+        data[name] = value.copy() if isinstance(value, (list, dict)) else value
+    return data
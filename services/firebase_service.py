@@ -2,10 +2,13 @@ import streamlit as st
 import firebase_admin
 from firebase_admin import credentials, firestore
 from typing import Dict, Any, List, Optional
+import logging
 import os
 from .data_service import DataService
 from models import UserProfile
 
+logger = logging.getLogger(__name__)
+
 
 class FirebaseService(DataService):
     """Firebase implementation of data service."""
@@ -50,19 +53,21 @@ class FirebaseService(DataService):
             return False
 
     def save_conversation(self, session_data: Dict[str, Any]) -> bool:
-        """Save conversation data to Firestore."""
+        """Save conversation data to Firestore.
+
+        Failures are logged and reported through the return value; the caller shows the UI feedback.
+        """
         try:
             if not self.db:
-                st.error("❌ מסד הנתונים לא מוכן")
+                logger.error("Cannot save conversation: Firestore is not initialized")
                 return False
 
             doc_ref = self.db.collection('conversations').document(session_data['session_id'])
             doc_ref.set(session_data)
-            st.success("✅ הנתונים נשמרו בהצלחה למסד הנתונים!")
             return True
 
-        except Exception as e:
-            st.error(f"❌ שגיאה בשמירת הנתונים: {str(e)}")
+        except Exception:
+            logger.exception("Failed to save conversation %s", session_data.get('session_id'))
             return False
 
     def get_conversation_stats(self) -> Dict[str, Any]:
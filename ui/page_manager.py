@@ -1,27 +1,32 @@
 import streamlit as st
-from typing import Optional, List, Dict, Any
+from typing import Optional, List, Dict, Any, Sequence, Generator
 from datetime import datetime
-from dataclasses import asdict
+from functools import lru_cache
+import hashlib
+import hmac
 import random
-from models import UserProfile, ChatMessage
+import time
+from models import UserProfile, ChatMessage, profile_to_dict
 from services import DataService, AIService
 from utils import DataExporter
 from .ui_components import UIComponents
 
 
-class PageManager:
-    """Manages all page rendering for the research application."""
+CHAT_HISTORY_WINDOW = 20
 
-    def __init__(self, data_service: DataService, ai_service: Optional[AIService] = None):
-        self.data_service = data_service
-        self.ai_service = ai_service
-        self.ui = UIComponents()
+# Speaker labels used when formatting the chat history as AI context
+ROLE_LABELS = {"user": "משתמש", "assistant": "עוזר"}
 
-    def render_main_menu(self) -> None:
-        """Render main menu with user and admin options."""
-        st.markdown("# 🔬 מחקר אקדמי על דעות ועמדות בחברה הישראלית")
+# Minimum seconds between streamed UI updates while an AI response is arriving
+STREAM_FLUSH_INTERVAL = 0.05
+STREAMING_DIV_OPEN = '<div class="streaming-text">'
+STREAMING_DIV_CLOSE = '</div>'
+THINKING_HTML = tuple(
+    STREAMING_DIV_OPEN + message + STREAMING_DIV_CLOSE
+    for message in ("🤔 חושב...", "🔍 מחפש מידע...", "💭 מנתח...")
+)
 
-        st.markdown("""
+MAIN_MENU_ABOUT = """
 **אודות המחקר:**
 * המחקר נערך לטובת מחקר אקדמי ומטרתו להבין טוב יותר את מגוון הדעות בחברה הישראלית
 * ההשתתפות היא וולונטרית ואנונימית לחלוטין
@@ -34,7 +39,168 @@ class PageManager:
 3. שאלון קצר נוסף לסיכום
 
 תודה על נכונותכם להשתתף במחקר זה!
-""", unsafe_allow_html=False)
+"""
+
+CHAT_GREETING = """שלום! אני כאן כדי לנהל איתך שיחה על נושאים שונים בחברה הישראלית. 
+תוכל לשאול אותי על כל נושא שמעניין אותך - פוליטיקה, חברה, כלכלה, או כל דבר אחר. 
+המטרה היא לנהל שיחה פתוחה וכנה.
+
+על מה תרצה לדבר?"""
+
+FEELING_THERMOMETER_CAPTION = """
+        דרג/י את הרגש שלך כלפי המפלגות הבאות, כאשר:
+        * 0 = רגש שלילי מאוד
+        * 50 = ניטרלי/אין דעה מיוחדת  
+        * 100 = רגש חיובי מאוד
+        """
+
+SOCIAL_DISTANCE_CAPTION = """
+        עד כמה היית מרגיש/ה בנוח במצבים הבאים עם אנשים שיש להם השקפות חברתיות-פוליטיות שונות מאוד משלך?
+        * 1 = מאוד לא בנוח
+        * 6 = מאוד בנוח
+        """
+
+
+def _index_map(options: Sequence[str]) -> Dict[str, int]:
+    """Map each option to its position for O(1) selectbox index lookups."""
+    return {option: i for i, option in enumerate(options)}
+
+
+SELECT_PLACEHOLDER = "בחר/י תשובה"
+
+GENDER_OPTIONS = (SELECT_PLACEHOLDER, "זכר", "נקבה", "אחר")
+REGION_OPTIONS = (SELECT_PLACEHOLDER, "חיפה והצפון", "אזור השרון", "אזור הדרום",
+                  "אזור ירושלים", "תל-אביב והמרכז", "יהודה ושומרון")
+MARITAL_STATUS_OPTIONS = (SELECT_PLACEHOLDER, "רווק/ה", "נשוי/נשואה", "בזוגיות", "גרוש/ה", "אלמן/ה")
+EDUCATION_OPTIONS = (SELECT_PLACEHOLDER, "תיכון", "הכשרה מקצועית", "תואר ראשון", "תואר שני",
+                     "תואר שלישי או מעלה")
+LAST_ELECTION_VOTE_OPTIONS = (SELECT_PLACEHOLDER, "הליכוד", "יש עתיד", "הציונות הדתית", "המחנה הממלכתי",
+                              "שס", "יהדות התורה", "ישראל ביתנו", "חדש-תעל", "רעם", "העבודה",
+                              "מרץ", "בלד", "עוצמה יהודית", "אחר", "לא הצבעתי")
+POLARIZATION_PERCEPTION_OPTIONS = (SELECT_PLACEHOLDER, "הקיטוב גבר", "הקיטוב לא השתנה", "הקיטוב פחת")
+VOTING_FREQUENCY_OPTIONS = (SELECT_PLACEHOLDER, "כן, תמיד", "ברוב המקרים", "לעיתים", "כמעט אף פעם", "אף פעם")
+PROTEST_PARTICIPATION_OPTIONS = (SELECT_PLACEHOLDER, "לא השתתפתי", "השתתפתי באירוע אחד",
+                                 "השתתפתי במספר אירועים", "השתתפתי באירועים רבים")
+MILITARY_SERVICE_OPTIONS = (SELECT_PLACEHOLDER, "כן, שירות מלא", "כן, שירות חלקי", "לא", "לא רלוונטי")
+POLITICAL_DISCUSSIONS_OPTIONS = (SELECT_PLACEHOLDER, "כמעט אף פעם", "לעיתים רחוקות", "לעיתים",
+                                 "לעיתים קרובות", "בקביעות")
+SOCIAL_MEDIA_ACTIVITY_OPTIONS = (SELECT_PLACEHOLDER, "כלל לא פעיל/ה", "קורא/ת אבל לא מגיב/ה",
+                                 "מגיב/ה לעיתים", "משתף/פת ומגיב/ה", "פעיל/ה מאוד")
+INFLUENCE_SOURCE_OPTIONS = ("חברים ומשפחה", "עיתונות מקצועית", "רשתות חברתיות", "אתרי חדשות",
+                            "רדיו וטלוויזיה", "מנהיגי דעת קהל", "ספרים ומחקרים אקדמיים", "ניסיון אישי")
+CONVERSATION_IMPACT_OPTIONS = (SELECT_PLACEHOLDER, "לא השפיעה כלל", "השפיעה מעט", "השפיעה במידה בינונית",
+                               "השפיעה הרבה", "השפיעה מאוד")
+
+GENDER_INDEX = _index_map(GENDER_OPTIONS)
+REGION_INDEX = _index_map(REGION_OPTIONS)
+MARITAL_STATUS_INDEX = _index_map(MARITAL_STATUS_OPTIONS)
+EDUCATION_INDEX = _index_map(EDUCATION_OPTIONS)
+LAST_ELECTION_VOTE_INDEX = _index_map(LAST_ELECTION_VOTE_OPTIONS)
+POLARIZATION_PERCEPTION_INDEX = _index_map(POLARIZATION_PERCEPTION_OPTIONS)
+VOTING_FREQUENCY_INDEX = _index_map(VOTING_FREQUENCY_OPTIONS)
+PROTEST_PARTICIPATION_INDEX = _index_map(PROTEST_PARTICIPATION_OPTIONS)
+MILITARY_SERVICE_INDEX = _index_map(MILITARY_SERVICE_OPTIONS)
+POLITICAL_DISCUSSIONS_INDEX = _index_map(POLITICAL_DISCUSSIONS_OPTIONS)
+SOCIAL_MEDIA_ACTIVITY_INDEX = _index_map(SOCIAL_MEDIA_ACTIVITY_OPTIONS)
+CONVERSATION_IMPACT_INDEX = _index_map(CONVERSATION_IMPACT_OPTIONS)
+
+# Required select/text questionnaire fields and their Hebrew display names (age is checked separately)
+REQUIRED_FIELDS = (
+    ("gender", "מגדר"), ("marital_status", "מצב משפחתי"),
+    ("region", "אזור מגורים"), ("education", "השכלה"),
+    ("last_election_vote", "הצבעה בבחירות האחרונות"),
+    ("polarization_perception", "תפיסת הקיטוב הפוליטי"),
+    ("voting_frequency", "תדירות הצבעה"),
+    ("protest_participation", "השתתפות בהפגנות"),
+    ("political_discussions", "דיונים פוליטיים"),
+    ("social_media_activity", "פעילות ברשתות חברתיות")
+)
+EMPTY_ANSWER_VALUES = frozenset({"", SELECT_PLACEHOLDER, None})
+
+# Fields added after the first release, backfilled onto profiles created by older versions
+PROFILE_FIELD_DEFAULTS = {
+    'last_election_vote': '',
+    'polarization_perception': '',
+    'military_service_recent': '',
+    'two_states_support_pre': 5,
+    'two_states_feasibility_pre': 5,
+    'security_impact_pre': 5,
+    'two_states_support_post': 5,
+    'two_states_feasibility_post': 5,
+    'security_impact_post': 5,
+    'conversation_impact': '',
+    'most_interesting': '',
+    'changed_mind': ''
+}
+
+RELIGIOSITY_LABELS = ("חילוני", "מסורתי", "דתי", "חרדי")
+RELIGIOSITY_VALUES = {label: i for i, label in enumerate(RELIGIOSITY_LABELS, 1)}
+POLITICAL_LABELS = ("שמאל", "מרכז-שמאל", "מרכז", "מרכז-ימין", "ימין")
+POLITICAL_VALUES = {label: i for i, label in enumerate(POLITICAL_LABELS, 1)}
+
+FEELING_THERMOMETER_PARTIES = (
+    "הליכוד",
+    "יש עתיד",
+    "הציונות הדתית",
+    "המחנה הממלכתי",
+    "ישראל ביתנו",
+    "העבודה",
+    "מרץ",
+    "עוצמה יהודית",
+    "המפלגות החרדיות",
+    "המפלגות הערביות"
+)
+
+SOCIAL_DISTANCE_SITUATIONS = (
+    "לגור באותה השכונה",
+    "לעבוד במקום עבודה משותף",
+    "לפתח חברות אישית",
+    "שבן/בת משפחה יהיה בקשר זוגי עם אדם כזה"
+)
+
+
+@lru_cache(maxsize=None)
+def _feeling_thermometer_keys(is_pre: bool, is_post_chat: bool) -> Dict[str, str]:
+    """Stable slider keys for each party, built once per questionnaire phase."""
+    prefix = f"{'postchat_' if is_post_chat else ''}feeling_"
+    postfix = f"_{'pre' if is_pre else 'post'}"
+    return {
+        party: f"{prefix}{party.replace(' ', '_').replace('״', '').replace('־', '_')}{postfix}"
+        for party in FEELING_THERMOMETER_PARTIES
+    }
+
+
+@lru_cache(maxsize=None)
+def _social_distance_keys(is_pre: bool, is_post_chat: bool) -> Dict[str, str]:
+    """Stable slider keys for each situation, built once per questionnaire phase."""
+    prefix = f"{'postchat_' if is_post_chat else ''}social_"
+    postfix = f"_{'pre' if is_pre else 'post'}"
+    return {
+        situation: f"{prefix}{situation.replace('/', '_').replace(' ', '_').replace('-', '_')}{postfix}"
+        for situation in SOCIAL_DISTANCE_SITUATIONS
+    }
+
+
+@lru_cache(maxsize=1)
+def _get_admin_password_digest() -> bytes:
+    """Read the admin password from secrets once and keep only its digest."""
+    return hashlib.sha256(st.secrets["ADMIN_PASSWORD"].encode()).digest()
+
+
+class PageManager:
+    """Manages all page rendering for the research application."""
+
+    def __init__(self, data_service: DataService, ai_service: Optional[AIService] = None,
+                 ui: Optional[UIComponents] = None):
+        self.data_service = data_service
+        self.ai_service = ai_service
+        self.ui = ui or UIComponents()
+
+    def render_main_menu(self) -> None:
+        """Render main menu with user and admin options."""
+        st.markdown("# 🔬 מחקר אקדמי על דעות ועמדות בחברה הישראלית")
+
+        st.markdown(MAIN_MENU_ABOUT, unsafe_allow_html=False)
 
         col1, col2, col3 = st.columns([1, 2, 1])
         with col2:
@@ -50,19 +216,23 @@ class PageManager:
 
             # Admin path
             st.markdown("#### 🔒 חוקרים")
-            admin_password = st.text_input("סיסמת חוקרים:", type="password", placeholder="סיסמה...")
-
-            if st.button("🔓 כניסה למערכת החוקרים", use_container_width=True):
-                if self._verify_admin_password(admin_password):
-                    st.session_state.app_mode = "admin"
-                    st.session_state.admin_authenticated = True
-                    st.success("✅ כניסה מוצלחת")
-                    st.rerun()
-                else:
-                    st.error("❌ סיסמה שגויה")
+            self._render_admin_login()
 
         self.ui.render_footer()
 
+    @st.fragment
+    def _render_admin_login(self) -> None:
+        """Render the admin login as a fragment so password entry doesn't rerun the whole menu."""
+        admin_password = st.text_input("סיסמת חוקרים:", type="password", placeholder="סיסמה...")
+
+        if st.button("🔓 כניסה למערכת החוקרים", use_container_width=True):
+            if self._verify_admin_password(admin_password):
+                st.session_state.update(app_mode="admin", admin_authenticated=True)
+                st.success("✅ כניסה מוצלחת")
+                st.rerun()
+            else:
+                st.error("❌ סיסמה שגויה")
+
     def render_questionnaire(self) -> bool:
         """Render pre-chat questionnaire."""
         self.ui.render_header(
@@ -83,8 +253,11 @@ class PageManager:
 
             if submitted:
                 if self._validate_questionnaire(profile_data, skip_validation):
-                    user_profile = self._create_user_profile(profile_data, existing_profile)
-                    self._save_temp_user_profile(user_profile)
+                    if existing_profile and self._profile_matches(existing_profile, profile_data):
+                        st.session_state.questionnaire_completed = True
+                    else:
+                        user_profile = self._create_user_profile(profile_data, existing_profile)
+                        self._save_temp_user_profile(user_profile)
                     st.success("תודה על מילוי השאלון! עובר לשיחה...")
                     st.rerun()
                     return True
@@ -108,16 +281,15 @@ class PageManager:
             st.error("❌ שירות הבינה המלאכותית אינו זמין כעת")
             return
 
+        self._render_chat_fragment()
+
+    @st.fragment
+    def _render_chat_fragment(self) -> None:
+        """Render chat history and input as a fragment so chat turns don't rerun the whole page."""
         # Initial message
         if not st.session_state.get("messages"):
             with st.chat_message("assistant"):
-                self.ui.render_rtl_message(
-                    """שלום! אני כאן כדי לנהל איתך שיחה על נושאים שונים בחברה הישראלית. 
-תוכל לשאול אותי על כל נושא שמעניין אותך - פוליטיקה, חברה, כלכלה, או כל דבר אחר. 
-המטרה היא לנהל שיחה פתוחה וכנה.
-
-על מה תרצה לדבר?"""
-                )
+                self.ui.render_rtl_message(CHAT_GREETING)
 
         self._render_chat_history()
 
@@ -138,9 +310,16 @@ class PageManager:
             return
 
         self._ensure_profile_compatibility(existing_profile)
+        self._render_post_chat_fragment(existing_profile)
+
+    @st.fragment
+    def _render_post_chat_fragment(self, existing_profile: UserProfile) -> None:
+        """Render the post-chat form and save section as a fragment so answer changes don't rerun the whole page."""
         post_data = self._render_post_chat_form(existing_profile)
-        self._update_profile_with_post_data(existing_profile, post_data)
-        st.session_state.temp_user_profile = existing_profile
+        # Only write back when an answer actually changed (button clicks also rerun this)
+        if not self._profile_matches(existing_profile, post_data):
+            self._update_profile_with_post_data(existing_profile, post_data)
+            st.session_state.temp_user_profile = existing_profile
 
         st.markdown("### 🔒 שמירת נתוני המחקר")
         col1, col2 = st.columns(2)
@@ -163,6 +342,11 @@ class PageManager:
             "כאן תוכל לראות, לנתח ולייצא את נתוני המחקר"
         )
 
+        self._render_admin_fragment()
+
+    @st.fragment
+    def _render_admin_fragment(self) -> None:
+        """Render the data viewer as a fragment so viewer interactions and refreshes don't rerun the app."""
         exporter = DataExporter(self.data_service)
         exporter.render_data_viewer_section()
 
@@ -171,18 +355,18 @@ class PageManager:
 
         with col1:
             if st.button("🔙 חזרה לתפריט הראשי", use_container_width=True):
-                st.session_state.app_mode = "main_menu"
-                st.session_state.admin_authenticated = False
+                st.session_state.update(app_mode="main_menu", admin_authenticated=False)
                 st.rerun()
 
         with col2:
             if st.button("🔄 רענן נתונים", use_container_width=True):
-                st.rerun()
+                st.rerun(scope="fragment")
 
     def _render_questionnaire_form(self, existing_profile: Optional[UserProfile]) -> Dict[str, Any]:
         """Render questionnaire form fields."""
         if existing_profile:
             self._ensure_profile_compatibility(existing_profile)
+        values = vars(existing_profile) if existing_profile else {}
 
         # Demographics
         st.markdown("### 👤 מידע בסיסי")
@@ -192,31 +376,30 @@ class PageManager:
         with col1:
             age = st.number_input(
                 "גיל:", min_value=18, max_value=120,
-                value=existing_profile.age if existing_profile and existing_profile.age > 0 else 30
+                value=values.get("age") or 30
             )
             gender = self._render_select(
                 "מגדר:",
-                ["בחר/י תשובה", "זכר", "נקבה", "אחר"],
-                existing_profile.gender if existing_profile else None
+                GENDER_OPTIONS, GENDER_INDEX,
+                values.get("gender")
             )
 
         with col2:
             region = self._render_select(
                 "אזור מגורים:",
-                ["בחר/י תשובה", "חיפה והצפון", "אזור השרון", "אזור הדרום",
-                 "אזור ירושלים", "תל-אביב והמרכז", "יהודה ושומרון"],
-                existing_profile.region if existing_profile else None
+                REGION_OPTIONS, REGION_INDEX,
+                values.get("region")
             )
             marital_status = self._render_select(
                 "מצב משפחתי:",
-                ["בחר/י תשובה", "רווק/ה", "נשוי/נשואה", "בזוגיות", "גרוש/ה", "אלמן/ה"],
-                existing_profile.marital_status if existing_profile else None
+                MARITAL_STATUS_OPTIONS, MARITAL_STATUS_INDEX,
+                values.get("marital_status")
             )
 
         education = self._render_select(
             "השכלה:",
-            ["בחר/י תשובה", "תיכון", "הכשרה מקצועית", "תואר ראשון", "תואר שני", "תואר שלישי או מעלה"],
-            existing_profile.education if existing_profile else None
+            EDUCATION_OPTIONS, EDUCATION_INDEX,
+            values.get("education")
         )
 
         # Social background
@@ -225,10 +408,10 @@ class PageManager:
 
         religiosity = st.select_slider(
             "איך היית מגדיר/ה את עצמך בהקשר הדתי?",
-            options=["חילוני", "מסורתי", "דתי", "חרדי"],
-            value=self._get_religiosity_label(existing_profile.religiosity if existing_profile else 1)
+            options=RELIGIOSITY_LABELS,
+            value=self._get_religiosity_label(values.get("religiosity", 1))
         )
-        religiosity_numeric = {"חילוני": 1, "מסורתי": 2, "דתי": 3, "חרדי": 4}[religiosity]
+        religiosity_numeric = RELIGIOSITY_VALUES[religiosity]
 
         # Political views
         st.markdown("### 🗳️ השקפות חברתיות")
@@ -236,10 +419,10 @@ class PageManager:
 
         political_stance = st.select_slider(
             "באיזה חלק של הקשת החברתית-פוליטית את/ה?",
-            options=["שמאל", "מרכז-שמאל", "מרכז", "מרכז-ימין", "ימין"],
-            value=self._get_political_label(existing_profile.political_stance if existing_profile else 3)
+            options=POLITICAL_LABELS,
+            value=self._get_political_label(values.get("political_stance", 3))
         )
-        political_numeric = {"שמאל": 1, "מרכז-שמאל": 2, "מרכז": 3, "מרכז-ימין": 4, "ימין": 5}[political_stance]
+        political_numeric = POLITICAL_VALUES[political_stance]
 
         # Voting behavior
         st.markdown("### 📊 התנהגות הצבעה ותפיסות פוליטיות")
@@ -247,16 +430,14 @@ class PageManager:
 
         last_election_vote = self._render_select(
             "למי הצבעת בבחירות הכנסת האחרונות?",
-            ["בחר/י תשובה", "הליכוד", "יש עתיד", "הציונות הדתית", "המחנה הממלכתי",
-             "שס", "יהדות התורה", "ישראל ביתנו", "חדש-תעל", "רעם", "העבודה",
-             "מרץ", "בלד", "עוצמה יהודית", "אחר", "לא הצבעתי"],
-            getattr(existing_profile, 'last_election_vote', '') if existing_profile else None
+            LAST_ELECTION_VOTE_OPTIONS, LAST_ELECTION_VOTE_INDEX,
+            values.get("last_election_vote")
         )
 
         polarization_perception = self._render_select(
             "האם לדעתך הקיטוב הפוליטי גבר בישראל בשלוש השנים האחרונות?",
-            ["בחר/י תשובה", "הקיטוב גבר", "הקיטוב לא השתנה", "הקיטוב פחת"],
-            getattr(existing_profile, 'polarization_perception', '') if existing_profile else None
+            POLARIZATION_PERCEPTION_OPTIONS, POLARIZATION_PERCEPTION_INDEX,
+            values.get("polarization_perception")
         )
 
         # Civic engagement
@@ -267,47 +448,44 @@ class PageManager:
         with col1:
             voting_frequency = self._render_select(
                 "האם את/ה נוהג להצביע בבחירות?",
-                ["בחר/י תשובה", "כן, תמיד", "ברוב המקרים", "לעיתים", "כמעט אף פעם", "אף פעם"],
-                existing_profile.voting_frequency if existing_profile else None
+                VOTING_FREQUENCY_OPTIONS, VOTING_FREQUENCY_INDEX,
+                values.get("voting_frequency")
             )
 
         with col2:
             protest_participation = self._render_select(
                 "השתתפות בהפגנות או עצרות (בשנתיים האחרונות):",
-                ["בחר/י תשובה", "לא השתתפתי", "השתתפתי באירוע אחד",
-                 "השתתפתי במספר אירועים", "השתתפתי באירועים רבים"],
-                existing_profile.protest_participation if existing_profile else None
+                PROTEST_PARTICIPATION_OPTIONS, PROTEST_PARTICIPATION_INDEX,
+                values.get("protest_participation")
             )
 
         with col3:
             military_service_recent = self._render_select(
                 "האם שירתת במילואים בשנתיים האחרונות?",
-                ["בחר/י תשובה", "כן, שירות מלא", "כן, שירות חלקי", "לא", "לא רלוונטי"],
-                getattr(existing_profile, 'military_service_recent', '') if existing_profile else None
+                MILITARY_SERVICE_OPTIONS, MILITARY_SERVICE_INDEX,
+                values.get("military_service_recent")
             )
 
         col1, col2 = st.columns(2)
         with col1:
             political_discussions = self._render_select(
                 "עד כמה את/ה נוהג/ת לדון בנושאים חברתיים עם אחרים?",
-                ["בחר/י תשובה", "כמעט אף פעם", "לעיתים רחוקות", "לעיתים", "לעיתים קרובות", "בקביעות"],
-                existing_profile.political_discussions if existing_profile else None
+                POLITICAL_DISCUSSIONS_OPTIONS, POLITICAL_DISCUSSIONS_INDEX,
+                values.get("political_discussions")
             )
 
         with col2:
             social_media_activity = self._render_select(
                 "עד כמה את/ה פעיל/ה ברשתות חברתיות בנושאים חברתיים?",
-                ["בחר/י תשובה", "כלל לא פעיל/ה", "קורא/ת אבל לא מגיב/ה",
-                 "מגיב/ה לעיתים", "משתף/פת ומגיב/ה", "פעיל/ה מאוד"],
-                existing_profile.social_media_activity if existing_profile else None
+                SOCIAL_MEDIA_ACTIVITY_OPTIONS, SOCIAL_MEDIA_ACTIVITY_INDEX,
+                values.get("social_media_activity")
             )
 
         # Information sources
         influence_sources = st.multiselect(
             "מאיזה מקורות את/ה בדרך כלל מקבל מידע על נושאים חברתיים? (ניתן לבחור מספר אפשרויות)",
-            options=["חברים ומשפחה", "עיתונות מקצועית", "רשתות חברתיות", "אתרי חדשות",
-                     "רדיו וטלוויזיה", "מנהיגי דעת קהל", "ספרים ומחקרים אקדמיים", "ניסיון אישי"],
-            default=existing_profile.influence_sources if existing_profile else [],
+            options=INFLUENCE_SOURCE_OPTIONS,
+            default=values.get("influence_sources", []),
             placeholder="בחר/י מקורות מידע"
         )
 
@@ -320,19 +498,19 @@ class PageManager:
             trust_political_system = self._render_slider(
                 "רמת האמון במוסדות הציבוריים בישראל:",
                 "1 = אין אמון כלל | 5 = אמון בינוני | 10 = אמון מלא",
-                existing_profile.trust_political_system if existing_profile else 5
+                values.get("trust_political_system", 5)
             )
             political_efficacy = self._render_slider(
                 "עד כמה אתה מרגיש שיש לך השפעה על מה שקורה במדינה:",
                 "1 = אין השפעה כלל | 5 = השפעה בינונית | 10 = השפעה רבה מאוד",
-                existing_profile.political_efficacy if existing_profile else 5
+                values.get("political_efficacy", 5)
             )
 
         with col2:
             political_anxiety = self._render_slider(
                 "רמת החששה מהמצב הכללי במדינה:",
                 "1 = לא מודאג/ת כלל | 5 = דאגה בינונית | 10 = מודאג/ת מאוד",
-                existing_profile.political_anxiety if existing_profile else 5
+                values.get("political_anxiety", 5)
             )
 
         # NEW: Two States Solution questions
@@ -344,43 +522,43 @@ class PageManager:
             two_states_support_pre = self._render_slider(
                 "באיזו מידה את/ה תומך/תומכת בפתרון של שתי מדינות לשני עמים?",
                 "1 = מתנגד/ת לגמרי | 10 = תומך/תומכת לגמרי",
-                getattr(existing_profile, 'two_states_support_pre', 5) if existing_profile else 5
+                values.get("two_states_support_pre", 5)
             )
 
         with col2:
             two_states_feasibility_pre = self._render_slider(
                 "באיזו מידה את/ה סבור/ה שפתרון זה אפשרי לביצוע במציאות?",
                 "1 = בלתי אפשרי | 10 = בהחלט אפשרי",
-                getattr(existing_profile, 'two_states_feasibility_pre', 5) if existing_profile else 5
+                values.get("two_states_feasibility_pre", 5)
             )
 
         with col3:
             security_impact_pre = self._render_slider(
                 "באיזו מידה לדעתך פתרון זה ישפר את ביטחון ישראל?",
                 "1 = יפגע בביטחון | 10 = ישפר מאוד את הביטחון",
-                getattr(existing_profile, 'security_impact_pre', 5) if existing_profile else 5
+                values.get("security_impact_pre", 5)
             )
 
         # Complex questions
-        feeling_thermometer = self._render_feeling_thermometer(existing_profile, is_pre=True)
-        social_distance = self._render_social_distance(existing_profile, is_pre=True)
+        feeling_thermometer = self._render_feeling_thermometer(values, is_pre=True)
+        social_distance = self._render_social_distance(values, is_pre=True)
 
         return {
-            "gender": gender if gender != "בחר/י תשובה" else "",
+            "gender": gender,
             "age": age,
-            "marital_status": marital_status if marital_status != "בחר/י תשובה" else "",
-            "region": region if region != "בחר/י תשובה" else "",
+            "marital_status": marital_status,
+            "region": region,
             "religiosity": religiosity_numeric,
-            "education": education if education != "בחר/י תשובה" else "",
+            "education": education,
             "political_stance": political_numeric,
-            "last_election_vote": last_election_vote if last_election_vote != "בחר/י תשובה" else "",
-            "polarization_perception": polarization_perception if polarization_perception != "בחר/י תשובה" else "",
-            "protest_participation": protest_participation if protest_participation != "בחר/י תשובה" else "",
-            "military_service_recent": military_service_recent if military_service_recent != "בחר/י תשובה" else "",
+            "last_election_vote": last_election_vote,
+            "polarization_perception": polarization_perception,
+            "protest_participation": protest_participation,
+            "military_service_recent": military_service_recent,
             "influence_sources": influence_sources,
-            "voting_frequency": voting_frequency if voting_frequency != "בחר/י תשובה" else "",
-            "political_discussions": political_discussions if political_discussions != "בחר/י תשובה" else "",
-            "social_media_activity": social_media_activity if social_media_activity != "בחר/י תשובה" else "",
+            "voting_frequency": voting_frequency,
+            "political_discussions": political_discussions,
+            "social_media_activity": social_media_activity,
             "trust_political_system": trust_political_system,
             "political_efficacy": political_efficacy,
             "political_anxiety": political_anxiety,
@@ -393,6 +571,7 @@ class PageManager:
 
     def _render_post_chat_form(self, existing_profile: UserProfile) -> Dict[str, Any]:
         """Render post-chat questionnaire form."""
+        values = vars(existing_profile)
         st.markdown("### 📄 לאחר השיחה")
         st.caption("כעת נבקש לענות שוב על כמה שאלות דומות, כדי לבחון האם השיחה השפיעה על דעותיך")
 
@@ -435,29 +614,28 @@ class PageManager:
                 5, "post_chat_security_impact"
             )
 
-        feeling_thermometer_post = self._render_feeling_thermometer(existing_profile, is_pre=False, is_post_chat=True)
-        social_distance_post = self._render_social_distance(existing_profile, is_pre=False, is_post_chat=True)
+        feeling_thermometer_post = self._render_feeling_thermometer(values, is_pre=False, is_post_chat=True)
+        social_distance_post = self._render_social_distance(values, is_pre=False, is_post_chat=True)
 
         # Reflection
         st.markdown("### 💭 רפלקציה על השיחה")
 
         impact = self._render_select(
             "האם השיחה השפיעה על דעותיך או נקודות המבט שלך?",
-            ["בחר/י תשובה", "לא השפיעה כלל", "השפיעה מעט", "השפיעה במידה בינונית",
-             "השפיעה הרבה", "השפיעה מאוד"],
-            getattr(existing_profile, 'conversation_impact', ''),
+            CONVERSATION_IMPACT_OPTIONS, CONVERSATION_IMPACT_INDEX,
+            values.get("conversation_impact", ""),
             "post_chat_conversation_impact"
         )
 
         interesting = st.text_area(
             "מה היה הדבר הכי מעניין או מפתיע בשיחה? (אופציונלי)",
-            value=getattr(existing_profile, 'most_interesting', ''),
+            value=values.get("most_interesting", ""),
             key="post_chat_most_interesting"
         )
 
         changed = st.text_area(
             "האם יש נושא שהשיחה גרמה לך לחשוב עליו אחרת? (אופציונלי)",
-            value=getattr(existing_profile, 'changed_mind', ''),
+            value=values.get("changed_mind", ""),
             key="post_chat_changed_mind"
         )
 
@@ -469,106 +647,81 @@ class PageManager:
             "security_impact_post": security_impact_post,
             "feeling_thermometer_post": feeling_thermometer_post,
             "social_distance_post": social_distance_post,
-            "conversation_impact": impact if impact != "בחר/י תשובה" else "",
+            "conversation_impact": impact,
             "most_interesting": interesting,
             "changed_mind": changed
         }
 
-    def _render_feeling_thermometer(self, existing_profile: Optional[UserProfile],
+    def _render_feeling_thermometer(self, profile_values: Dict[str, Any],
                                     is_pre: bool = True, is_post_chat: bool = False) -> Dict[str, int]:
         """Render feeling thermometer for political parties."""
         st.markdown("### 🌡️ דירוג רגשי למפלגות")
-        st.caption("""
-        דרג/י את הרגש שלך כלפי המפלגות הבאות, כאשר:
-        * 0 = רגש שלילי מאוד
-        * 50 = ניטרלי/אין דעה מיוחדת  
-        * 100 = רגש חיובי מאוד
-        """)
-
-        # Updated parties list
-        parties = [
-            "הליכוד",
-            "יש עתיד",
-            "הציונות הדתית",
-            "המחנה הממלכתי",
-            "ישראל ביתנו",
-            "העבודה",
-            "מרץ",
-            "עוצמה יהודית",
-            "המפלגות החרדיות",
-            "המפלגות הערביות"
-        ]
-
-        # Randomize for pre-chat, keep order for post-chat
-        if is_pre and not is_post_chat:
-            parties = parties.copy()
-            random.shuffle(parties)
-
-        feeling_thermometer = {}
-        existing_data = {}
+        st.caption(FEELING_THERMOMETER_CAPTION)
 
-        if existing_profile and not is_post_chat:
-            existing_data = existing_profile.feeling_thermometer_pre if is_pre else existing_profile.feeling_thermometer_post
+        # Randomize once per session for pre-chat, keep order for post-chat
+        parties = FEELING_THERMOMETER_PARTIES
+        if is_pre and not is_post_chat:
+            parties = st.session_state.get("_party_order_pre")
+            if parties is None:
+                parties = random.sample(FEELING_THERMOMETER_PARTIES, len(FEELING_THERMOMETER_PARTIES))
+                st.session_state._party_order_pre = parties
+
+        defaults = {}
+        if not is_post_chat:
+            defaults = profile_values.get("feeling_thermometer_pre" if is_pre else "feeling_thermometer_post", {})
+        get_default = defaults.get
+
+        # Use stable keys - no timestamps
+        keys = _feeling_thermometer_keys(is_pre, is_post_chat)
+
+        def render_party(party: str) -> int:
+            return st.slider(
+                f"{party}:",
+                min_value=0, max_value=100,
+                value=get_default(party, 50),
+                key=keys[party]
+            )
 
         col1, col2 = st.columns(2)
-        for i, party in enumerate(parties):
-            with col1 if i % 2 == 0 else col2:
-                # Use stable keys - no timestamps
-                key_suffix = f"{'postchat_' if is_post_chat else ''}feeling_{party.replace(' ', '_').replace('״', '').replace('־', '_')}_{('pre' if is_pre else 'post')}"
-
-                feeling_thermometer[party] = st.slider(
-                    f"{party}:",
-                    min_value=0, max_value=100,
-                    value=existing_data.get(party, 50) if not is_post_chat else 50,
-                    key=key_suffix
-                )
+        with col1:
+            feeling_thermometer = {party: render_party(party) for party in parties[::2]}
+        with col2:
+            feeling_thermometer.update({party: render_party(party) for party in parties[1::2]})
 
         return feeling_thermometer
 
-    def _render_social_distance(self, existing_profile: Optional[UserProfile],
+    def _render_social_distance(self, profile_values: Dict[str, Any],
                                 is_pre: bool = True, is_post_chat: bool = False) -> Dict[str, int]:
         """Render social distance questions."""
         st.markdown("### 🤝 מרחק חברתי")
-        st.caption("""
-        עד כמה היית מרגיש/ה בנוח במצבים הבאים עם אנשים שיש להם השקפות חברתיות-פוליטיות שונות מאוד משלך?
-        * 1 = מאוד לא בנוח
-        * 6 = מאוד בנוח
-        """)
-
-        situations = [
-            "לגור באותה השכונה",
-            "לעבוד במקום עבודה משותף",
-            "לפתח חברות אישית",
-            "שבן/בת משפחה יהיה בקשר זוגי עם אדם כזה"
-        ]
+        st.caption(SOCIAL_DISTANCE_CAPTION)
 
-        social_distance = {}
         existing_data = {}
+        if not is_post_chat:
+            existing_data = profile_values.get("social_distance_pre" if is_pre else "social_distance_post", {})
+        get_default = existing_data.get
 
-        if existing_profile and not is_post_chat:
-            existing_data = existing_profile.social_distance_pre if is_pre else existing_profile.social_distance_post
-
-        for i, situation in enumerate(situations):
-            # Use stable keys - no timestamps
-            clean_situation = situation.replace('/', '_').replace(' ', '_').replace('-', '_')
-            key_suffix = f"{'postchat_' if is_post_chat else ''}social_{clean_situation}_{('pre' if is_pre else 'post')}"
+        # Use stable keys - no timestamps
+        keys = _social_distance_keys(is_pre, is_post_chat)
 
+        social_distance = {}
+        for situation in SOCIAL_DISTANCE_SITUATIONS:
             social_distance[situation] = st.slider(
                 f"{situation}:",
                 min_value=1, max_value=6,
-                value=existing_data.get(situation, 3) if not is_post_chat else 3,
-                key=key_suffix
+                value=get_default(situation, 3),
+                key=keys[situation]
             )
 
         return social_distance
 
     # Helper methods
-    def _render_select(self, label: str, options: List[str], current_value: Optional[str],
-                       key: Optional[str] = None) -> str:
-        """Helper to render select box with default handling."""
-        current = current_value or "בחר/י תשובה"
-        index = options.index(current) if current in options else 0
-        return st.selectbox(label, options=options, index=index, key=key)
+    def _render_select(self, label: str, options: Sequence[str], index_map: Dict[str, int],
+                       current_value: Optional[str], key: Optional[str] = None) -> str:
+        """Helper to render select box with default handling; the placeholder comes back as ""."""
+        index = index_map.get(current_value or SELECT_PLACEHOLDER, 0)
+        choice = st.selectbox(label, options=options, index=index, key=key)
+        return "" if choice == SELECT_PLACEHOLDER else choice
 
     def _render_slider(self, label: str, caption: str, default: int, key: Optional[str] = None) -> int:
         """Helper to render slider with caption."""
@@ -578,61 +731,36 @@ class PageManager:
 
     def _get_religiosity_label(self, value: int) -> str:
         """Convert religiosity number to label."""
-        return ["חילוני", "מסורתי", "דתי", "חרדי"][max(0, min(3, value - 1))]
+        return RELIGIOSITY_LABELS[max(0, min(3, value - 1))]
 
     def _get_political_label(self, value: int) -> str:
         """Convert political stance number to label."""
-        return ["שמאל", "מרכז-שמאל", "מרכז", "מרכז-ימין", "ימין"][max(0, min(4, value - 1))]
+        return POLITICAL_LABELS[max(0, min(4, value - 1))]
 
     def _ensure_profile_compatibility(self, profile: UserProfile) -> None:
         """Ensure profile has all required fields."""
-        defaults = {
-            'last_election_vote': '',
-            'polarization_perception': '',
-            'military_service_recent': '',
-            'two_states_support_pre': 5,
-            'two_states_feasibility_pre': 5,
-            'security_impact_pre': 5,
-            'two_states_support_post': 5,
-            'two_states_feasibility_post': 5,
-            'security_impact_post': 5,
-            'conversation_impact': '',
-            'most_interesting': '',
-            'changed_mind': ''
-        }
-
-        for field, default in defaults.items():
-            if not hasattr(profile, field):
-                setattr(profile, field, default)
+        # Profiles created by an older UserProfile class lack the newer attributes on the instance
+        values = vars(profile)
+        for field_name, default in PROFILE_FIELD_DEFAULTS.items():
+            if field_name not in values:
+                setattr(profile, field_name, default)
 
     def _validate_questionnaire(self, data: Dict[str, Any], skip: bool) -> bool:
         """Validate questionnaire completeness."""
         if skip:
             return True
 
-        required = {
-            "gender": "מגדר", "age": "גיל", "marital_status": "מצב משפחתי",
-            "region": "אזור מגורים", "education": "השכלה",
-            "last_election_vote": "הצבעה בבחירות האחרונות",
-            "polarization_perception": "תפיסת הקיטוב הפוליטי",
-            "voting_frequency": "תדירות הצבעה",
-            "protest_participation": "השתתפות בהפגנות",
-            "political_discussions": "דיונים פוליטיים",
-            "social_media_activity": "פעילות ברשתות חברתיות"
-        }
-
-        missing = [name for key, name in required.items()
-                   if not data.get(key) or data.get(key) == "בחר/י תשובה"]
-
+        # Cheap scalar checks first, then the scan over the remaining select fields
+        missing = []
         if data.get("age", 0) <= 0:
             missing.append("גיל")
-
         if not data.get("influence_sources"):
             missing.append("מקורות מידע")
 
+        missing.extend(name for key, name in REQUIRED_FIELDS if data.get(key) in EMPTY_ANSWER_VALUES)
+
         if missing:
-            st.error(f"אנא השלם: {', '.join(missing)}")
-            st.error("או סמן 'דלג על שדות שלא מולאו'")
+            st.error(f"אנא השלם: {', '.join(missing)}\n\nאו סמן 'דלג על שדות שלא מולאו'")
             return False
 
         return True
@@ -642,23 +770,25 @@ class PageManager:
         """Create or update user profile."""
         if existing:
             self._ensure_profile_compatibility(existing)
-            for key, value in data.items():
-                setattr(existing, key, value)
+            vars(existing).update(data)
             return existing
 
         profile = UserProfile(**data)
         self._ensure_profile_compatibility(profile)
         return profile
 
+    def _profile_matches(self, profile: UserProfile, data: Dict[str, Any]) -> bool:
+        """Check whether the submitted answers are identical to the stored profile."""
+        values = vars(profile)
+        return all(values.get(key) == value for key, value in data.items())
+
     def _save_temp_user_profile(self, profile: UserProfile) -> None:
         """Save profile to session."""
-        st.session_state.temp_user_profile = profile
-        st.session_state.questionnaire_completed = True
+        st.session_state.update(temp_user_profile=profile, questionnaire_completed=True)
 
     def _update_profile_with_post_data(self, profile: UserProfile, data: Dict[str, Any]) -> None:
         """Update profile with post-chat data."""
-        for key, value in data.items():
-            setattr(profile, key, value)
+        vars(profile).update(data)
 
     # Chat methods
     def _render_sidebar(self) -> None:
@@ -679,15 +809,34 @@ class PageManager:
             st.caption("💡 תוכל לסיים בכל שלב")
 
     def _render_chat_history(self) -> None:
-        """Render chat message history."""
-        for message in st.session_state.get("messages", []):
-            with st.chat_message(message["role"]):
-                self.ui.render_rtl_message(message["content"])
+        """Render chat message history, building HTML only for messages not seen before."""
+        messages = st.session_state.get("messages", [])
+        rendered = st.session_state.setdefault("_chat_html", [])
+        if len(rendered) > len(messages):
+            rendered.clear()
+        rendered.extend(
+            (message["role"], self.ui.rtl_message_html(message["content"]))
+            for message in messages[len(rendered):]
+        )
+
+        window = st.session_state.setdefault("_history_window", CHAT_HISTORY_WINDOW)
+        if len(messages) > window:
+            st.button(
+                f"טען {CHAT_HISTORY_WINDOW} הודעות קודמות",
+                on_click=self._expand_history_window
+            )
+
+        for role, html in rendered[-window:]:
+            with st.chat_message(role):
+                st.markdown(html, unsafe_allow_html=True)
+
+    @staticmethod
+    def _expand_history_window() -> None:
+        """Show another page of older messages in the chat history."""
+        st.session_state._history_window += CHAT_HISTORY_WINDOW
 
     def _handle_user_input(self, prompt: str) -> None:
         """Process user input and generate response."""
-        import time
-
         # Add user message
         self._add_message("user", prompt)
         with st.chat_message("user"):
@@ -696,37 +845,73 @@ class PageManager:
         # Generate response
         with st.chat_message("assistant"):
             placeholder = st.empty()
-            thinking = ["🤔 חושב...", "🔍 מחפש מידע...", "💭 מנתח..."][time.time_ns() % 3]
-            placeholder.markdown(f'<div class="streaming-text">{thinking}</div>', unsafe_allow_html=True)
+            placeholder.markdown(random.choice(THINKING_HTML), unsafe_allow_html=True)
 
             try:
                 profile = st.session_state.get("temp_user_profile")
                 context = self._get_chat_context()
-                full_response = ""
-
-                for chunk in self.ai_service.generate_response_stream(prompt, profile, context):
-                    if chunk and chunk.strip():
-                        full_response += chunk
-                        placeholder.markdown(
-                            f'<div class="streaming-text">{full_response}</div>',
-                            unsafe_allow_html=True
-                        )
+                full_response = st.write_stream(
+                    self._stream_response_chunks(placeholder, prompt, profile, context)
+                )
 
-                if full_response:
+                # write_stream returns a list only for non-text chunks, which this generator never yields
+                if isinstance(full_response, str) and full_response.strip():
                     self._add_message("assistant", full_response)
 
             except Exception as e:
                 error = f"❌ שגיאה: {str(e)}"
-                placeholder.markdown(f'<div class="streaming-text">{error}</div>', unsafe_allow_html=True)
+                placeholder.markdown(STREAMING_DIV_OPEN + error + STREAMING_DIV_CLOSE, unsafe_allow_html=True)
                 self._add_message("assistant", error)
 
+    def _stream_response_chunks(self, placeholder, prompt: str, profile: Optional[UserProfile],
+                                context: str) -> Generator[str, None, None]:
+        """Yield response text in batches, clearing the thinking indicator on the first one.
+
+        Chunks are buffered and flushed at most every STREAM_FLUSH_INTERVAL seconds,
+        or right away when a chunk ends a line, so fast streams don't re-render per token.
+        Whitespace-only chunks are kept in the text and flush only when they carry a newline;
+        a batch that is still only whitespace stays buffered until real text follows.
+        """
+        pending = []
+        last_flush = time.monotonic()
+
+        for chunk in self.ai_service.generate_response_stream(prompt, profile, context):
+            if not chunk:
+                continue
+
+            pending.append(chunk)
+            has_newline = "\n" in chunk
+            if not has_newline and not chunk.strip():
+                continue
+
+            now = time.monotonic()
+            if now - last_flush < STREAM_FLUSH_INTERVAL and not has_newline:
+                continue
+
+            batch = "".join(pending)
+            if not batch.strip():
+                continue
+
+            if placeholder is not None:
+                placeholder.empty()
+                placeholder = None
+            yield batch
+            pending.clear()
+            last_flush = now
+
+        remainder = "".join(pending)
+        if remainder.strip():
+            if placeholder is not None:
+                placeholder.empty()
+            yield remainder
+
     def _add_message(self, role: str, content: str) -> None:
         """Add message to history."""
-        if "messages" not in st.session_state:
-            st.session_state.messages = []
-
         message = ChatMessage(role=role, content=content)
-        st.session_state.messages.append(message.to_dict())
+        st.session_state.setdefault("messages", []).append(message.to_dict())
+
+        counts = st.session_state.setdefault("_message_counts", {"user": 0, "assistant": 0})
+        counts[role] = counts.get(role, 0) + 1
 
     def _get_chat_context(self) -> str:
         """Get formatted chat context."""
@@ -734,61 +919,98 @@ class PageManager:
         if not messages:
             return ""
 
-        return "\n\n".join([
-            f"{'משתמש' if msg['role'] == 'user' else 'עוזר'}: {msg['content']}"
-            for msg in messages
-        ])
+        # Format only messages added since the last call and keep the joined text
+        cache = st.session_state.setdefault("_chat_context_cache", {"len": 0, "parts": [], "text": ""})
+        if cache["len"] != len(messages):
+            if cache["len"] > len(messages):
+                cache["len"], cache["parts"] = 0, []
+            cache["parts"].extend(
+                f"{ROLE_LABELS[msg['role']]}: {msg['content']}"
+                for msg in messages[cache["len"]:]
+            )
+            cache["len"] = len(messages)
+            cache["text"] = "\n\n".join(cache["parts"])
+
+        return cache["text"]
 
     # Data methods
     def _save_conversation_data(self) -> bool:
-        """Save conversation data."""
+        """Save conversation data, showing an error if the write fails."""
         try:
             profile = st.session_state.get("temp_user_profile")
-            messages = st.session_state.get("messages", [])
+            messages = st.session_state.get("messages")
 
             if not profile or not messages:
                 st.error("שגיאה: חסרים נתונים")
                 return False
 
+            message_counts = st.session_state.get("_message_counts", {})
             session_data = {
                 "session_id": profile.session_id,
                 "created_at": profile.created_at,
                 "finished_at": datetime.now().isoformat(),
-                "user_profile": asdict(profile),
+                "user_profile": profile_to_dict(profile),
                 "conversation": messages,
                 "session_info": {
                     "total_messages": len(messages),
-                    "start_time": messages[0]["timestamp"] if messages else None,
-                    "end_time": messages[-1]["timestamp"] if messages else None
+                    "start_time": messages[0]["timestamp"],
+                    "end_time": messages[-1]["timestamp"]
+                },
+                # Read by DataExporter and FirebaseService.get_conversations_preview
+                "conversation_stats": {
+                    "total_messages": len(messages),
+                    "user_messages": message_counts.get("user", 0),
+                    "bot_messages": message_counts.get("assistant", 0),
+                    "duration_minutes": self._calculate_duration(messages)
                 }
             }
 
-            return self.data_service.save_conversation(session_data)
+            with st.spinner("שומר את הנתונים..."):
+                saved = self.data_service.save_conversation(session_data)
+
+            if not saved:
+                st.error("❌ שגיאה בשמירת הנתונים, אנא נסה/י שוב")
+            return saved
 
         except Exception as e:
             st.error(f"שגיאה בשמירה: {str(e)}")
             return False
 
+    def _calculate_duration(self, messages: List[Dict[str, Any]]) -> float:
+        """Calculate conversation duration in minutes from stored epoch-ms timestamps."""
+        if not messages:
+            return 0.0
+
+        first, last = messages[0], messages[-1]
+        if first.get("ts_ms") is not None and last.get("ts_ms") is not None:
+            return round((last["ts_ms"] - first["ts_ms"]) / 60000, 2)
+
+        # Older messages, or ones built from a given timestamp, only carry the ISO string
+        try:
+            start = datetime.fromisoformat(first["timestamp"])
+            end = datetime.fromisoformat(last["timestamp"])
+            return round((end - start).total_seconds() / 60, 2)
+        except (KeyError, ValueError, TypeError):
+            return 0.0
+
     def _verify_admin_password(self, password: str) -> bool:
         """Verify admin password."""
         try:
-            return password == st.secrets["ADMIN_PASSWORD"]
-        except KeyError:
+            expected = _get_admin_password_digest()
+        except (KeyError, FileNotFoundError):
             st.error("❌ סיסמת מנהל לא מוגדרת")
             return False
 
+        return hmac.compare_digest(expected, hashlib.sha256(password.encode()).digest())
+
     # Reset methods
     def _reset_application(self) -> None:
         """Reset application for new session."""
-        for key in list(st.session_state.keys()):
-            del st.session_state[key]
+        st.session_state.clear()
         st.rerun()
 
     def _reset_to_main_menu(self) -> None:
         """Reset to main menu."""
-        keys_to_keep = []
-        for key in list(st.session_state.keys()):
-            if key not in keys_to_keep:
-                del st.session_state[key]
+        st.session_state.clear()
         st.session_state.app_mode = "main_menu"
         st.rerun()
\ No newline at end of file
@@ -2,6 +2,9 @@ import streamlit as st
 from typing import List, Any
 
 
+FOOTER_HTML = '<div style="direction: rtl; text-align: center; color: gray;">אוניברסיטת רייכמן | 2025</div>'
+
+
 class UIComponents:
     """Reusable UI components and styling."""
 
@@ -257,13 +260,15 @@ class UIComponents:
         """
         st.markdown(rtl_css, unsafe_allow_html=True)
 
+    @staticmethod
+    def rtl_message_html(content: str) -> str:
+        """Build the RTL-wrapped HTML for a message without rendering it."""
+        return f'<div style="direction: rtl; text-align: right;">{content}</div>'
+
     @staticmethod
     def render_rtl_message(content: str) -> None:
         """Render message with RTL formatting."""
-        st.markdown(
-            f'<div style="direction: rtl; text-align: right;">{content}</div>',
-            unsafe_allow_html=True
-        )
+        st.markdown(UIComponents.rtl_message_html(content), unsafe_allow_html=True)
 
     @staticmethod
     def render_mobile_header(title: str) -> None:
@@ -278,28 +283,14 @@ class UIComponents:
         if subtitle:
             st.markdown(f"**{subtitle}**")
         if description:
-            st.markdown(
-                f'<div style="direction: rtl; text-align: right;">{description}</div>',
-                unsafe_allow_html=True
-            )
+            st.markdown(UIComponents.rtl_message_html(description), unsafe_allow_html=True)
         st.markdown("---")
 
-    @staticmethod
-    def get_selectbox_index(options: List[str], value: str) -> int:
-        """Get index of value in options list."""
-        try:
-            return options.index(value)
-        except ValueError:
-            return 0
-
     @staticmethod
     def render_footer() -> None:
         """Render application footer."""
         st.markdown("---")
-        st.markdown(
-            '<div style="direction: rtl; text-align: center; color: gray;">אוניברסיטת רייכמן | 2025</div>',
-            unsafe_allow_html=True
-        )
+        st.markdown(FOOTER_HTML, unsafe_allow_html=True)
 
     @staticmethod
     def show_loading(message: str = "טוען...") -> None: